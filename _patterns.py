@@ -0,0 +1,18 @@
+﻿# Text Analyzer patterns by Muhammad GAZEL, GHAZALTECH.COM
+# I keep every compiled pattern and translate table here so each one is built once per process.
+import re
+
+# I compile the word pattern once so repeated analyses skip the regex cache lookup. Words are
+# runs of word characters joined by apostrophes, which needs no \b checks and barely backtracks.
+WORD_RE = re.compile(r"\w+(?:'+\w+)*")
+
+# I map every ASCII character outside [A-Za-z0-9_'] to a space so plain split() finds the same words.
+ASCII_NON_WORD_TO_SPACE = {code: " " for code in range(128) if not (chr(code).isalnum() or chr(code) in "_'")}
+
+# I list every character str.isspace accepts (all of them sit at or below U+3000) so the
+# character counts stay identical to a per-character isspace check.
+WHITESPACE = "".join(char for char in map(chr, range(0x3001)) if char.isspace())
+WHITESPACE_DELETE = dict.fromkeys(map(ord, WHITESPACE))
+
+# I split sentences on the whitespace that follows terminal punctuation.
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
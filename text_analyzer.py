@@ -1,23 +1,59 @@
 ﻿# Text Analyzer by Muhammad GAZEL, GHAZALTECH.COM
 # I keep the imports explicit so the script reads clearly at a glance.
+from __future__ import annotations
+
+import functools
+import itertools
 import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 import textwrap
 
-try:
-    import nltk
+# I import NLTK on first use (see _import_nltk) because loading it is the slowest part of startup.
+if TYPE_CHECKING:
     from nltk.sentiment import SentimentIntensityAnalyzer
+
+# I use pyahocorasick for topic scans when it is installed and fall back to one regex otherwise.
+try:
+    import ahocorasick
 except ImportError:
-    print("nltk is required for this project. Install it with 'pip install nltk' and run again.")
-    sys.exit(1)
+    ahocorasick = None
+
+from _patterns import ASCII_NON_WORD_TO_SPACE, SENTENCE_SPLIT_RE, WHITESPACE, WHITESPACE_DELETE, WORD_RE
+
+
+# I score long texts sentence by sentence because VADER is tuned for sentence-sized input.
+_SENTENCE_SCORING_THRESHOLD = 4096
+_SCORE_PRECISION = {"neg": 3, "neu": 3, "pos": 3, "compound": 4}
+_SENTIMENT_LABELS = ("Negative", "Neutral", "Positive")
+
+# I stream files in 1 MiB chunks so memory stays flat no matter how large the file is.
+_STREAM_CHUNK_SIZE = 1 << 20
+_PREVIEW_LENGTH = 200
+
+# I reuse one wrapper for every panel instead of building a fresh one per line.
+_PANEL_WRAPPER = textwrap.TextWrapper()
+
+
+# I load NLTK only when sentiment is first needed so both apps open without waiting on it.
+def _import_nltk() -> ModuleType:
+    try:
+        import nltk
+        import nltk.sentiment
+    except ImportError:
+        print("nltk is required for this project. Install it with 'pip install nltk' and run again.")
+        sys.exit(1)
+    return nltk
 
 
 # I make sure the sentiment lexicon is ready before running the analyzer.
 def ensure_vader_lexicon() -> None:
+    nltk = _import_nltk()
     try:
         nltk.data.find("sentiment/vader_lexicon.zip")
     except LookupError:
@@ -25,6 +61,13 @@ def ensure_vader_lexicon() -> None:
         nltk.download("vader_lexicon")
 
 
+# I build the analyzer once per process so every entry point shares the loaded lexicon.
+@functools.lru_cache(maxsize=1)
+def get_analyzer() -> SentimentIntensityAnalyzer:
+    ensure_vader_lexicon()
+    return _import_nltk().sentiment.SentimentIntensityAnalyzer()
+
+
 # I draw a lightweight banner to welcome anyone who runs this tool.
 def display_banner() -> None:
     width = 74
@@ -41,15 +84,15 @@ def print_panel(title: str, lines: List[str]) -> None:
     inner_width = max(len(title) + 4, max((len(line) for line in lines), default=0))
     inner_width = max(inner_width, 48)
     border = "+" + "-" * (inner_width + 2) + "+"
-    print(border)
-    print(f"| {title.center(inner_width)} |")
-    print("| " + "-" * inner_width + " |")
+    rows = [border, f"| {title.center(inner_width)} |", "| " + "-" * inner_width + " |"]
+    _PANEL_WRAPPER.width = inner_width
     for line in lines:
-        wrapped = textwrap.wrap(line, inner_width) or [""]
+        wrapped = _PANEL_WRAPPER.wrap(line) or [""]
         for segment in wrapped:
-            print(f"| {segment.ljust(inner_width)} |")
-    print(border)
-    print()
+            rows.append(f"| {segment.ljust(inner_width)} |")
+    rows.append(border)
+    # I write the whole panel at once so large tables cost one write instead of one per row.
+    sys.stdout.write("\n".join(rows) + "\n\n")
 
 
 # I collect the user's preferred input method so the flow feels guided.
@@ -69,23 +112,35 @@ def prompt_input_method() -> str:
         print("Please type 1 or 2 so I know which route to take.\n")
 
 
+# I yield a file in fixed-size chunks so large files never sit in memory all at once, and I
+# read the next chunk on a helper thread (disk reads release the GIL) while this one is analyzed.
+def iter_file_chunks(path: Path, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8", errors="replace", buffering=chunk_size) as file_handle:
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(file_handle.read, chunk_size)
+            while True:
+                chunk = pending.result()
+                if not chunk:
+                    return
+                pending = reader.submit(file_handle.read, chunk_size)
+                yield chunk
+
+
 # I read text from disk and validate the path so users get quick feedback.
-def read_text_from_file() -> str:
+def read_text_from_file() -> Iterable[str]:
     while True:
         raw_path = input("\nEnter the path to your text file: ").strip().strip('"')
         if not raw_path:
             print("Please provide a file path so I can keep going.")
             continue
-        candidate = Path(os.path.expanduser(raw_path)).resolve()
+        candidate = Path(os.path.expanduser(raw_path))
         if not candidate.is_file():
             print("I could not find that file. Double-check the path and try again.")
             continue
-        try:
-            text = candidate.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text = candidate.read_text(encoding="utf-8", errors="replace")
-        if text.strip():
-            return text
+        chunks = iter_file_chunks(candidate)
+        for chunk in chunks:
+            if not chunk.isspace():
+                return itertools.chain((chunk,), chunks)
         print("That file looks empty. Pick another file or use manual input.")
 
 
@@ -109,42 +164,255 @@ def read_text_from_input() -> str:
 
 
 # I gather the final text payload based on the user's selection.
-def collect_text() -> str:
+def collect_text() -> Iterable[str]:
     while True:
         method = prompt_input_method()
         if method == "1":
             return read_text_from_file()
-        return read_text_from_input()
+        return (read_text_from_input(),)
 
 
-# I keep the sentiment labels in one place so they stay consistent.
+# I keep the sentiment labels in one place so they stay consistent, and I index the label
+# table with the two threshold checks so there is no branching at all.
 def label_sentiment(score: float) -> str:
-    if score >= 0.05:
-        return "Positive"
-    if score <= -0.05:
-        return "Negative"
-    return "Neutral"
+    return _SENTIMENT_LABELS[1 + (score >= 0.05) - (score <= -0.05)]
+
+
+# I count visible characters in C: translate is fastest on ASCII text, while str.count
+# per whitespace character wins once the text holds wider code points.
+def count_non_whitespace(text: str) -> int:
+    if text.isascii():
+        return len(text.translate(WHITESPACE_DELETE))
+    return len(text) - sum(map(text.count, WHITESPACE))
+
+
+# I tokenize ASCII text with translate and split, which both run in C and beat the regex
+# engine several times over; apostrophes at word edges are trimmed just like the regex does.
+def extract_words(text: str) -> List[str]:
+    if not text.isascii():
+        return [word.lower() for word in WORD_RE.findall(text)]
+    words = text.lower().translate(ASCII_NON_WORD_TO_SPACE).split()
+    if "'" in text:
+        words = [word.strip("'") if word[0] == "'" or word[-1] == "'" else word for word in words]
+        if "" in words:
+            words = [word for word in words if word]
+    return words
+
+
+# I fold sentence scores into length-weighted totals so long texts can be scored piece by piece.
+def accumulate_sentence_scores(
+    sentences: Iterable[str], analyzer: SentimentIntensityAnalyzer, totals: Dict[str, float]
+) -> None:
+    for sentence in sentences:
+        sentence = sentence.lstrip()
+        if not sentence:
+            continue
+        weight = len(sentence)
+        scores = analyzer.polarity_scores(sentence)
+        for key in _SCORE_PRECISION:
+            totals[key] += scores[key] * weight
+        totals["weight"] += weight
+
+
+# I turn the weighted totals back into VADER-style scores with VADER's own rounding.
+def average_sentence_scores(totals: Dict[str, float]) -> Dict[str, float]:
+    return {key: round(totals[key] / totals["weight"], digits) for key, digits in _SCORE_PRECISION.items()}
+
+
+# I average sentence scores by sentence length so long documents keep a meaningful tone.
+def score_sentiment(text: str, analyzer: SentimentIntensityAnalyzer) -> Dict[str, float]:
+    if not text:
+        return {"compound": 0.0, "pos": 0.0, "neu": 0.0, "neg": 0.0}
+    if len(text) <= _SENTENCE_SCORING_THRESHOLD:
+        return analyzer.polarity_scores(text)
+    totals = dict.fromkeys((*_SCORE_PRECISION, "weight"), 0.0)
+    accumulate_sentence_scores(SENTENCE_SPLIT_RE.split(text), analyzer, totals)
+    return average_sentence_scores(totals)
+
+
+# I find every topic keyword in a single pass over the text, however many topics there are,
+# and only count matches that stand as whole words.
+class TopicScanner:
+    def __init__(self, topics: Iterable[str]) -> None:
+        self.topics = sorted({topic.strip().lower() for topic in topics if topic.strip()}, key=len, reverse=True)
+        self._automaton = None
+        self._pattern = None
+
+    def build(self) -> "TopicScanner":
+        if not self.topics:
+            return self
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for topic in self.topics:
+                self._automaton.add_word(topic, topic)
+            self._automaton.make_automaton()
+        else:
+            alternatives = "|".join(map(re.escape, self.topics))
+            # I step over a leading run of apostrophes so the start boundary can look past it,
+            # which a fixed-width lookbehind cannot.
+            self._pattern = re.compile(rf"(?<![\w'])'*({alternatives})(?!'*\w)")
+        return self
+
+    def iter(self, text: str) -> Iterator[str]:
+        if self._automaton is not None:
+            # I keep the whole-word hits and then take them leftmost-longest, like the regex does.
+            matches = []
+            for end, topic in self._automaton.iter(text):
+                start = end - len(topic) + 1
+                if _joins_word(text, start - 1, -1) or _joins_word(text, end + 1, 1):
+                    continue
+                matches.append((start, -len(topic), topic))
+            matches.sort()
+            resume_at = 0
+            for start, _, topic in matches:
+                if start >= resume_at:
+                    resume_at = start + len(topic)
+                    yield topic
+        elif self._pattern is not None:
+            yield from self._pattern.findall(text)
+
+    def count(self, text: str, counts: Counter) -> None:
+        counts.update(self.iter(text.lower()))
+
+
+# I match \w here, so the automaton's boundaries agree with the regex and with WORD_RE.
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+# I treat a neighbour as part of the word only where WORD_RE would join it: a word character,
+# or a run of apostrophes with another word character beyond it, as in "dogs'" versus "don't".
+def _joins_word(text: str, index: int, step: int) -> bool:
+    while 0 <= index < len(text) and text[index] == "'":
+        index += step
+    return 0 <= index < len(text) and _is_word_char(text[index])
 
 
 # I run all calculations in one pass so the analysis stays fast.
-def analyze_text(text: str, analyzer: SentimentIntensityAnalyzer) -> Dict[str, object]:
-    cleaned = text.strip()
-    words = re.findall(r"\b[\w']+\b", cleaned.lower())
-    word_count = len(words)
-    characters_with_spaces = len(cleaned)
-    characters_without_spaces = sum(1 for char in cleaned if not char.isspace())
-    word_frequencies = Counter(words).most_common(5)
-    sentiment_scores = analyzer.polarity_scores(cleaned) if cleaned else {"compound": 0.0, "pos": 0.0, "neu": 0.0, "neg": 0.0}
+def analyze_text(
+    text: str, analyzer: SentimentIntensityAnalyzer, topics: Optional[List[str]] = None
+) -> Dict[str, object]:
+    return analyze_chunks((text,), analyzer, topics)
+
+
+# I cut a run without sentence breaks once it outgrows the chunk size: after the last whitespace
+# in its first _STREAM_CHUNK_SIZE + 1 characters, or else after the first whitespace beyond them.
+# I only look inside the run's own text, never at where a chunk ended, so a run cuts the same
+# way whether it arrives whole or in pieces; an unfinished run simply waits for more text.
+def _split_long_run(run: str) -> List[str]:
+    if len(run) <= _STREAM_CHUNK_SIZE:
+        return [run]
+    pieces = []
+    begin = 0
+    end = len(run.rstrip())
+    while end - begin > _STREAM_CHUNK_SIZE:
+        start = begin
+        while run[start].isspace():
+            start += 1
+        limit = start + _STREAM_CHUNK_SIZE + 1
+        if end < limit:
+            break
+        cut = max(run.rfind(char, start, limit) for char in WHITESPACE) + 1
+        if not cut:
+            beyond = [index for index in (run.find(char, limit, end) for char in WHITESPACE) if index >= 0]
+            if not beyond:
+                break
+            cut = min(beyond) + 1
+        pieces.append(run[begin:cut])
+        begin = cut
+    pieces.append(run[begin:])
+    return pieces
+
+
+# I analyze text piece by piece, carrying any unfinished sentence into the next chunk so the
+# totals match a single pass over the whole text while memory stays bounded by the chunk size.
+# A run with no sentence breaks longer than the chunk size is cut by _split_long_run in both
+# cases, so only sentences that long are scored in pieces.
+def analyze_chunks(
+    chunks: Iterable[str], analyzer: SentimentIntensityAnalyzer, topics: Optional[List[str]] = None
+) -> Dict[str, object]:
+    scanner = TopicScanner(topics).build() if topics else None
+    topic_counts: Counter = Counter()
+    word_counts: Counter = Counter()
+    word_count = 0
+    characters_with_spaces = 0
+    characters_without_spaces = 0
+    trailing_whitespace = 0
+    head = ""
+    carry = ""
+    held_segments: List[str] = []
+    totals: Dict[str, float] = {}
+    for chunk in chunks:
+        if not characters_with_spaces:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+        characters_without_spaces += count_non_whitespace(chunk)
+        body = chunk.rstrip()
+        if body:
+            characters_with_spaces += trailing_whitespace + len(body)
+            trailing_whitespace = len(chunk) - len(body)
+        else:
+            trailing_whitespace += len(chunk)
+        if len(head) <= _PREVIEW_LENGTH:
+            head += chunk[: _PREVIEW_LENGTH + 1 - len(head)]
+
+        buffer = carry + chunk
+        sentences = SENTENCE_SPLIT_RE.split(buffer)
+        carry = sentences.pop()
+        if len(buffer) > _STREAM_CHUNK_SIZE:
+            sentences = [piece for sentence in sentences for piece in _split_long_run(sentence)]
+            *pieces, carry = _split_long_run(carry)
+            sentences.extend(pieces)
+        if not sentences:
+            continue
+        segment = buffer[: len(buffer) - len(carry)]
+        words = extract_words(segment)
+        word_count += len(words)
+        word_counts.update(words)
+        if scanner:
+            scanner.count(segment, topic_counts)
+
+        if totals:
+            accumulate_sentence_scores(sentences, analyzer, totals)
+        elif characters_with_spaces > _SENTENCE_SCORING_THRESHOLD:
+            totals = dict.fromkeys((*_SCORE_PRECISION, "weight"), 0.0)
+            accumulate_sentence_scores(SENTENCE_SPLIT_RE.split("".join(held_segments)), analyzer, totals)
+            accumulate_sentence_scores(sentences, analyzer, totals)
+            held_segments = []
+        else:
+            held_segments.append(segment)
+
+    carry = carry.rstrip()
+    words = extract_words(carry)
+    word_count += len(words)
+    word_counts.update(words)
+    if scanner:
+        scanner.count(carry, topic_counts)
+    if totals:
+        accumulate_sentence_scores(_split_long_run(carry), analyzer, totals)
+        sentiment_scores = average_sentence_scores(totals)
+    else:
+        held_segments.append(carry)
+        sentiment_scores = score_sentiment("".join(held_segments), analyzer)
     sentiment_label = label_sentiment(sentiment_scores["compound"])
-    return {
+    # I reuse the running length for the preview; head[:n] hands back head itself when nothing is cut.
+    if characters_with_spaces > _PREVIEW_LENGTH:
+        preview = f"{head[:_PREVIEW_LENGTH]}..."
+    else:
+        preview = head[:characters_with_spaces]
+    summary = {
         "words": word_count,
         "chars_with_spaces": characters_with_spaces,
         "chars_without_spaces": characters_without_spaces,
-        "top_words": word_frequencies,
+        "top_words": word_counts.most_common(5),
         "sentiment_label": sentiment_label,
         "sentiment_scores": sentiment_scores,
-        "preview": (cleaned[:200] + "...") if len(cleaned) > 200 else cleaned,
+        "preview": preview,
     }
+    if scanner:
+        summary["topics"] = topic_counts
+    return summary
 
 
 # I format the frequency table so it reads like a quick leaderboard.
@@ -177,16 +445,19 @@ def show_results(summary: dict) -> None:
         f"Positive: {scores['pos']:.3f} | Neutral: {scores['neu']:.3f} | Negative: {scores['neg']:.3f}",
     ]
     print_panel("Sentiment", sentiment_lines)
+
+    if "topics" in summary:
+        topic_lines = [f"{topic} - {count} time(s)" for topic, count in summary["topics"].most_common()]
+        print_panel("Topic Mentions", topic_lines or ["None of the topics appear in this text."])
     print("Thanks for exploring your text with this analyzer.\n")
 
 
 # I orchestrate the flow so running the script feels effortless.
 def main() -> None:
     display_banner()
-    ensure_vader_lexicon()
-    analyzer = SentimentIntensityAnalyzer()
-    text = collect_text()
-    results = analyze_text(text, analyzer)
+    analyzer = get_analyzer()
+    chunks = collect_text()
+    results = analyze_chunks(chunks, analyzer)
     show_results(results)
 
 
@@ -1,20 +1,75 @@
 ﻿# Text Analyzer GUI by Muhammad GAZEL, GHAZALTECH.COM
 # I keep this GUI aligned with the console analyzer so both stay consistent.
 
+import functools
 import tkinter as tk
+from collections import Counter
+from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext
-from typing import List
+from types import SimpleNamespace
+from typing import Dict, List, Optional
 
+from _patterns import WHITESPACE
 from text_analyzer import (
-    SentimentIntensityAnalyzer,
     analyze_text as console_analyze_text,
-    ensure_vader_lexicon,
+    count_non_whitespace,
+    extract_words,
     format_top_words as console_format_top_words,
+    get_analyzer,
+    label_sentiment,
+    score_sentiment,
 )
 
-# I reuse the same analyzer instance to keep results identical in both apps.
-ensure_vader_lexicon()
-analyzer = SentimentIntensityAnalyzer()
+# I update live counts shortly after typing stops and rescore sentiment after a longer pause.
+LIVE_COUNTS_DELAY_MS = 150
+LIVE_SENTIMENT_DELAY_MS = 500
+LIVE_SENTIMENT_LIMIT = 100_000
+LIVE_SPAN_START = "live_span_start"
+LIVE_SPAN_END = "live_span_end"
+
+# I build Tcl regex classes from the analyzer's whitespace set so Tk searches split the text
+# exactly where str.isspace does.
+TCL_WHITESPACE = "[" + "".join(f"\\u{ord(char):04x}" for char in WHITESPACE) + "]"
+TCL_NON_WHITESPACE = "[^" + TCL_WHITESPACE[1:]
+
+live_words: Counter = Counter()
+live_stats = {"words": 0, "chars": 0, "chars_without_spaces": 0}
+live_sentiment: Dict[str, object] = {}
+live_jobs: Dict[str, Optional[str]] = {"counts": None, "sentiment": None}
+live_edit: Dict[str, Optional[str]] = {"before": None}
+
+# I stand in for the text widget's command in Tcl itself. Everything but an edit goes straight
+# to the real widget, so its errors reach Tk's own catch probes (copy with no selection, the
+# selection anchor check) untouched; edits and undo call back into Python around the real call.
+LIVE_TEXT_PROXY = """
+proc live_text_proxy {widget begin finish rebuild args} {
+    switch -- [lindex $args 0] {
+        insert - delete - replace {
+            $begin {*}$args
+            set result [$widget {*}$args]
+            $finish
+            return $result
+        }
+        edit {
+            set result [$widget {*}$args]
+            if {[lindex $args 1] in {undo redo}} {
+                $rebuild
+            }
+            return $result
+        }
+        default {
+            return [$widget {*}$args]
+        }
+    }
+}
+"""
+
+
+# I remember sentence scores so live rescoring only pays for the sentences that changed. The
+# shared analyzer is built by the first Analyze Text press, so the window opens before NLTK loads.
+@functools.lru_cache(maxsize=1)
+def get_sentence_scorer() -> SimpleNamespace:
+    return SimpleNamespace(polarity_scores=functools.lru_cache(maxsize=4096)(get_analyzer().polarity_scores))
 
 
 def load_file() -> None:
@@ -22,8 +77,10 @@ def load_file() -> None:
     if not path:
         return
     try:
-        with open(path, "r", encoding="utf-8") as file_handle:
-            content = file_handle.read()
+        # I decode the whole file in one C call and only translate newlines when the file has any \r.
+        content = Path(path).read_bytes().decode("utf-8", errors="replace")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
     except Exception as exc:
         messagebox.showerror("File Error", f"Could not read the selected file.\n\nDetails: {exc}")
         return
@@ -32,44 +89,183 @@ def load_file() -> None:
 
 
 def run_analysis() -> None:
-    raw_text = input_box.get("1.0", tk.END).strip()
-    if not raw_text:
+    raw_text = input_text()
+    if not raw_text or raw_text.isspace():
         messagebox.showwarning("No Text", "Please enter or load some text first.")
         return
 
-    results = console_analyze_text(raw_text, analyzer)
+    results = console_analyze_text(raw_text, get_analyzer())
+    show_output(results)
+
+
+def show_output(results: Dict[str, object]) -> None:
     freq_lines: List[str] = console_format_top_words(results["top_words"])
-    scores = results["sentiment_scores"]
-
-    output_lines: List[str] = [
-        f"Word count: {results['words']}",
-        f"Characters (with spaces): {results['chars_with_spaces']}",
-        f"Characters (without spaces): {results['chars_without_spaces']}",
-        "",
-        "Top 5 Words:",
-    ]
-    output_lines.extend(freq_lines)
-    output_lines.extend(
-        [
-            "",
-            f"Sentiment: {results['sentiment_label']}",
-            (
-                "Scores -> "
-                f"Pos: {scores['pos']:.3f}, "
-                f"Neu: {scores['neu']:.3f}, "
-                f"Neg: {scores['neg']:.3f}, "
-                f"Compound: {scores['compound']:.3f}"
-            ),
-        ]
+    freq_block = "\n".join(freq_lines)
+    scores = results.get("sentiment_scores")
+    if scores is None:
+        sentiment = results.get("sentiment_note", "Sentiment: updating once you pause typing...")
+    else:
+        sentiment = (
+            f"Sentiment: {results['sentiment_label']}\n"
+            f"Scores -> Pos: {scores['pos']:.3f}, Neu: {scores['neu']:.3f}, "
+            f"Neg: {scores['neg']:.3f}, Compound: {scores['compound']:.3f}"
+        )
+
+    # I fill one fixed template; only the variable-length frequency list needs a join.
+    compiled_output = (
+        f"Word count: {results['words']}\n"
+        f"Characters (with spaces): {results['chars_with_spaces']}\n"
+        f"Characters (without spaces): {results['chars_without_spaces']}\n"
+        "\n"
+        "Top 5 Words:\n"
+        f"{freq_block}\n"
+        "\n"
+        f"{sentiment}"
     )
+    write_output(compiled_output)
 
-    compiled_output = "\n".join(output_lines).strip()
+
+def write_output(compiled_output: str) -> None:
     output_box.config(state="normal")
     output_box.delete("1.0", tk.END)
     output_box.insert(tk.END, compiled_output)
     output_box.config(state="disabled")
 
 
+# I route every read and edit through the renamed Tcl command so the proxy is never re-entered.
+def input_call(*args: str) -> object:
+    return root.tk.call((input_command,) + args)
+
+
+# I read the buffer straight from the renamed Tcl command, skipping the trailing newline and
+# the edit-tracking proxy, so a large text crosses from Tcl to Python only once.
+def input_text() -> str:
+    return str(input_call("get", "1.0", "end-1c"))
+
+
+def update_live_counts(text: str, sign: int) -> None:
+    words = extract_words(text)
+    live_stats["words"] += sign * len(words)
+    live_stats["chars"] += sign * len(text)
+    live_stats["chars_without_spaces"] += sign * count_non_whitespace(text)
+    if sign > 0:
+        live_words.update(words)
+        return
+    for word in words:
+        live_words[word] -= 1
+        if not live_words[word]:
+            del live_words[word]
+
+
+def rebuild_live_counts() -> None:
+    live_words.clear()
+    live_stats.update(words=0, chars=0, chars_without_spaces=0)
+    update_live_counts(input_text(), 1)
+
+
+def clamp_index(index: str) -> str:
+    index = str(input_call("index", index))
+    if root.tk.getboolean(input_call("compare", index, ">", "end-1c")):
+        return str(input_call("index", "end-1c"))
+    return index
+
+
+# I keep live totals per edit: words never cross whitespace, so re-reading only the span from
+# the whitespace before the edit to the whitespace after it keeps every counter exact. The
+# marks ride along with the edit, so the same span can be read again once it lands.
+def mark_edit_span(command: str, args: tuple) -> None:
+    if command == "insert":
+        touched = [args[0]]
+    elif command == "delete" and len(args) == 1:
+        touched = [args[0], f"{args[0]} +1c"]
+    elif command == "delete":
+        touched = list(args)
+    else:
+        touched = [args[0], args[1]]
+    touched = [clamp_index(index) for index in touched]
+    first = last = touched[0]
+    for index in touched[1:]:
+        if root.tk.getboolean(input_call("compare", index, "<", first)):
+            first = index
+        if root.tk.getboolean(input_call("compare", index, ">", last)):
+            last = index
+
+    before = str(input_call("search", "-backwards", "-regexp", "--", TCL_WHITESPACE, first, "1.0"))
+    after = str(input_call("search", "-regexp", "--", TCL_WHITESPACE, last, "end"))
+    input_call("mark", "set", LIVE_SPAN_START, f"{before} +1c" if before else "1.0")
+    input_call("mark", "gravity", LIVE_SPAN_START, "left")
+    input_call("mark", "set", LIVE_SPAN_END, after or "end-1c")
+    input_call("mark", "gravity", LIVE_SPAN_END, "right")
+
+
+def begin_input_edit(command: str, *args: str) -> None:
+    # I skip the bookkeeping when an index does not resolve (paste with no selection); the real
+    # edit then fails on its own in Tcl, or finish_input_edit recounts if it goes through anyway.
+    try:
+        mark_edit_span(command, args)
+        live_edit["before"] = str(input_call("get", LIVE_SPAN_START, LIVE_SPAN_END))
+    except tk.TclError:
+        live_edit["before"] = None
+
+
+def finish_input_edit() -> None:
+    before, live_edit["before"] = live_edit["before"], None
+    if before is None:
+        rebuild_live_counts()
+    else:
+        update_live_counts(before, -1)
+        update_live_counts(str(input_call("get", LIVE_SPAN_START, LIVE_SPAN_END)), 1)
+    schedule_live_refresh()
+
+
+def rebuild_after_undo() -> None:
+    rebuild_live_counts()
+    schedule_live_refresh()
+
+
+def schedule_live_refresh() -> None:
+    for job, delay, callback in (
+        ("counts", LIVE_COUNTS_DELAY_MS, refresh_live_output),
+        ("sentiment", LIVE_SENTIMENT_DELAY_MS, refresh_live_sentiment),
+    ):
+        if live_jobs[job] is not None:
+            root.after_cancel(live_jobs[job])
+        live_jobs[job] = root.after(delay, callback)
+
+
+def refresh_live_output() -> None:
+    live_jobs["counts"] = None
+    first = str(input_call("search", "-regexp", "--", TCL_NON_WHITESPACE, "1.0", "end"))
+    if not first:
+        write_output("")
+        return
+    last = str(input_call("search", "-backwards", "-regexp", "--", TCL_NON_WHITESPACE, "end-1c", "1.0"))
+    leading = int(input_call("count", "-chars", "1.0", first))
+    trailing = int(input_call("count", "-chars", f"{last} +1c", "end-1c"))
+    results = {
+        "words": live_stats["words"],
+        "chars_with_spaces": live_stats["chars"] - leading - trailing,
+        "chars_without_spaces": live_stats["chars_without_spaces"],
+        "top_words": live_words.most_common(5),
+        **live_sentiment,
+    }
+    show_output(results)
+
+
+def refresh_live_sentiment() -> None:
+    live_jobs["sentiment"] = None
+    live_sentiment.clear()
+    # I leave loading NLTK (and any lexicon download) to Analyze Text, so typing never stalls on it.
+    if not get_analyzer.cache_info().currsize:
+        live_sentiment["sentiment_note"] = "Sentiment: press Analyze Text to load the sentiment model."
+    elif live_stats["chars"] > LIVE_SENTIMENT_LIMIT:
+        live_sentiment["sentiment_note"] = "Sentiment: press Analyze Text to score texts this long."
+    else:
+        scores = score_sentiment(input_text().strip(), get_sentence_scorer())
+        live_sentiment.update(sentiment_label=label_sentiment(scores["compound"]), sentiment_scores=scores)
+    refresh_live_output()
+
+
 root = tk.Tk()
 root.title("Text Analyzer - GHAZALTECH.COM")
 root.geometry("780x740")
@@ -141,6 +337,24 @@ input_box = scrolledtext.ScrolledText(
 )
 input_box.pack(padx=12, pady=10, fill=tk.BOTH, expand=True)
 
+# I route the text widget's Tcl command through live_text_proxy so every edit, typed,
+# pasted or loaded, updates the live counters with only the words around it.
+input_command = input_box._w + "_text"
+root.tk.call("rename", input_box._w, input_command)
+root.tk.eval(LIVE_TEXT_PROXY)
+root.tk.call(
+    "interp",
+    "alias",
+    "",
+    input_box._w,
+    "",
+    "live_text_proxy",
+    input_command,
+    root.register(begin_input_edit),
+    root.register(finish_input_edit),
+    root.register(rebuild_after_undo),
+)
+
 output_label = tk.Label(
     root,
     text="Analysis Results",